@@ -5,7 +5,7 @@ File: personal_finance_tracker.py
 Project description
 -------------------
 A clean, dependency-free command-line Personal Finance Tracker built with Python data structures.
-It stores transactions as a list of `Transaction` dataclasses (an array of structures), supports
+It stores transactions in a `TransactionStore` (a list of `Transaction` dataclasses), supports
 sorting, searching and filtering, can save/load data from a JSON file, and includes an ASCII
 bar chart visualization for monthly spending.
 
@@ -23,7 +23,9 @@ What changed in this version (debugged)
 
 Why this is GitHub-ready
 - Single-file, readable, and well-documented Python code.
-- No third-party dependencies (works with Python 3.8+).
+- No third-party dependencies (works with Python 3.8+); numpy is optional and enables the
+  columnar `TransactionTable` for large ledgers, and numba (if installed) JIT-compiles its
+  balance summary. orjson, if installed, speeds up JSON save/load.
 - Clear functions and a simple CLI for demo and extension.
 
 Features
@@ -31,9 +33,11 @@ Features
 - List transactions (with optional sorting by date/amount/category).
 - Search transactions by keyword or ID.
 - Filter (e.g., expenses over $100, by category, by date range).
-- Save to / load from JSON file (with sandbox-safe fallback).
+- Save to / load from JSON file (with sandbox-safe fallback), or Parquet/Feather when the
+  filename ends in `.parquet`/`.feather` and pyarrow is installed.
 - Monthly spending ASCII bar chart (nice visual summary).
 - Sample demo data generator and batch import/export.
+- Optional NumPy-backed `TransactionTable` (struct of arrays) for vectorized filters and reports.
 - CLI flags for demo/tests and non-interactive environments.
 
 How to run
@@ -59,25 +63,53 @@ Notes
 - Amounts are numbers; you can use positive for income and positive for expense as long as you set
   `ttype` accordingly. If you prefer negative numbers for expenses, the balance calculator will
   normalize them.
+- Large ledgers (optional, needs numpy): the menu and demo work on a `TransactionStore`, whose
+  indexes are updated on every add/delete. To run many reports over a big ledger that does not
+  change, build a columnar table once and pass it to the same functions:
+
+    table = TransactionTable(load_transactions('ledger.json'))
+    balance_summary(table); monthly_spending(table); filter_expenses_over(table, 100)
+
+  Filters on a table return a new table; iterate it (or `list(table)`) to get `Transaction`s.
+  Building the table is a one-off O(N) conversion, so it is not done implicitly per report.
 
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Callable, Tuple
+from dataclasses import dataclass, field
+from typing import List, Optional, Callable, Tuple, Iterable, Iterator
 import json
 from datetime import datetime
 import sys
 import os
 import tempfile
 import argparse
+import io
+import math
+from collections import defaultdict
+from operator import attrgetter
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is used without it
+    orjson = None
+
+# numpy, numba and pyarrow are optional too, but slow to import, so they are only loaded on
+# first use (see _import_numpy, _numba_kernel and _import_pyarrow) rather than at startup.
+np = None
 
 DATE_FORMAT = "%Y-%m-%d"
 
 # Default file lives in a temp directory to avoid sandbox write restrictions.
 DEFAULT_SAVE_FILE = os.path.join(tempfile.gettempdir(), "transactions.json")
 
-@dataclass
+# Slotted instances (no per-object __dict__) need dataclass(slots=True), added in Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Transaction:
     id: int
     date: str  # YYYY-MM-DD
@@ -85,28 +117,474 @@ class Transaction:
     category: str
     ttype: str  # 'income' or 'expense'
     description: str = ""
+    # Lowercased copies reused by search/filter/sort instead of calling .lower() per row
+    _category_lower: str = field(init=False, repr=False, compare=False)
+    _description_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Categories and types come from a small vocabulary: intern them so loaded rows share
+        # one string object each (and == hits CPython's identity shortcut). Descriptions are not.
+        self.category = sys.intern(self.category)
+        self.ttype = sys.intern(self.ttype)
+        self._category_lower = sys.intern(self.category.lower())
+        self._description_lower = self.description.lower()
 
     def to_dict(self):
-        return asdict(self)
+        # Fields are all immutable primitives, so build the dict directly rather than via
+        # dataclasses.asdict (which deep-copies every value and would include the cached fields)
+        return {'id': self.id, 'date': self.date, 'amount': self.amount, 'category': self.category,
+                'ttype': self.ttype, 'description': self.description}
 
     @staticmethod
     def from_dict(d: dict) -> 'Transaction':
+        date = str(d['date'])
+        if len(date) != 10:
+            # Older files may hold unpadded dates such as '2025-1-5'; pad them so they sort
+            try:
+                date = normalize_date(date)
+            except ValueError:
+                pass
         return Transaction(
             id=int(d['id']),
-            date=str(d['date']),
+            date=date,
             amount=float(d['amount']),
             category=str(d.get('category', '')),
             ttype=str(d.get('ttype', 'expense')),
             description=str(d.get('description', ''))
         )
 
+    @staticmethod
+    def _fast_from_json(d: dict) -> 'Transaction':
+        """Build from a freshly decoded JSON record. Records this app wrote already have the
+        right types, so skip the coercions and the generated __init__; anything else (e.g. a
+        hand-edited file with string amounts or nulls) goes through from_dict."""
+        tid = d.get('id')
+        date = d.get('date')
+        amount = d.get('amount')
+        category = d.get('category', '')
+        ttype = d.get('ttype', 'expense')
+        description = d.get('description', '')
+        if (type(tid) is not int or type(amount) is not float or type(date) is not str or len(date) != 10
+                or type(category) is not str or type(ttype) is not str or type(description) is not str):
+            return Transaction.from_dict(d)
+        t = Transaction.__new__(Transaction)
+        t.id = tid
+        t.date = date
+        t.amount = amount
+        t.category = category
+        t.ttype = ttype
+        t.description = description
+        t.__post_init__()
+        return t
+
+# ------------------------- Columnar Table (optional NumPy backend) -------------------------
+
+# The compiled balance loop is ~3x faster than the NumPy masks, but importing numba and
+# loading the kernel costs ~300 ms once; only tables this large save enough per call to repay it.
+NUMBA_MIN_ROWS = 100_000
+
+# balance kernel once compiled; False if numba is not installed
+_NUMBA_KERNEL = None
+
+
+def _import_numpy():
+    """Import numpy on first use; returns None if it is not installed."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+
+def _balance_summary_kernel(amounts, is_income):
+    inc = 0.0
+    exp = 0.0
+    for i in range(amounts.size):
+        a = amounts[i]
+        if is_income[i]:
+            inc += a
+        else:
+            exp += a if a >= 0 else -a
+    return inc, exp, inc - exp
+
+
+def _numba_kernel():
+    """JIT-compile the balance kernel on first use; returns None if numba is not installed."""
+    global _NUMBA_KERNEL
+    if _NUMBA_KERNEL is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _NUMBA_KERNEL = False
+        else:
+            _NUMBA_KERNEL = njit(cache=True)(_balance_summary_kernel)
+    return _NUMBA_KERNEL or None
+
+
+class TransactionTable:
+    """Struct-of-arrays view of a ledger, backed by NumPy arrays.
+
+    Every field lives in its own array (categories and types as small integer codes
+    into `category_names` / `ttype_names`, with boolean `is_income` / `is_expense`
+    masks derived from the type), so the filters and reports below become single
+    vectorized expressions instead of per-row Python loops. Filters return a new
+    `TransactionTable`; iterating a table yields `Transaction` objects, so it can be
+    passed to `pretty_print_transactions`.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = ()):
+        if _import_numpy() is None:
+            raise ImportError("TransactionTable requires numpy (pip install numpy)")
+        txs = list(transactions)
+        n = len(txs)
+        self.category_names, self.categories = self._encode([t.category for t in txs])
+        self.ttype_names, self.ttypes = self._encode([t.ttype for t in txs])
+        self.ids = np.fromiter((t.id for t in txs), dtype=np.int64, count=n)
+        self.dates = np.array([t.date for t in txs], dtype='datetime64[D]')
+        self.amounts = np.fromiter((t.amount for t in txs), dtype=np.float64, count=n)
+        self.descriptions = np.array([t.description for t in txs], dtype=object)
+        self._index_types()
+        self._date_order = None
+
+    @staticmethod
+    def _encode(values: List[str]):
+        """Return (sorted unique values, array of integer codes into them)."""
+        names = sorted(set(values))
+        lookup = {v: i for i, v in enumerate(names)}
+        code_dtype = np.int8 if len(names) <= 127 else np.int32
+        return names, np.fromiter((lookup[v] for v in values), dtype=code_dtype, count=len(values))
+
+    @staticmethod
+    def _code_mask(codes, wanted: List[int]):
+        # A single code (the usual case) is a plain comparison, much cheaper than np.isin
+        if len(wanted) == 1:
+            return codes == wanted[0]
+        return np.isin(codes, wanted)
+
+    def _type_mask(self, ttype: str):
+        return self._code_mask(self.ttypes, [i for i, name in enumerate(self.ttype_names) if name == ttype])
+
+    def _index_types(self) -> None:
+        self.is_income = self._type_mask('income')
+        self.is_expense = self._type_mask('expense')
+
+    def _date_index(self):
+        """Return (date-sorted permutation, sorted dates) for searchsorted range queries.
+
+        Built on first use: most filter results are only summed or printed, never date-sorted.
+        """
+        if self._date_order is None:
+            self._date_order = np.argsort(self.dates, kind='stable')
+            self._sorted_dates = self.dates[self._date_order]
+        return self._date_order, self._sorted_dates
+
+    def select(self, rows) -> 'TransactionTable':
+        """Return a new table holding only `rows` (a boolean mask or index array)."""
+        if rows.dtype == bool:
+            # Fancy-indexing by positions is several times cheaper per column than by mask
+            rows = np.flatnonzero(rows)
+        sub = TransactionTable.__new__(TransactionTable)
+        sub.category_names = self.category_names
+        sub.ttype_names = self.ttype_names
+        sub.ids = self.ids[rows]
+        sub.dates = self.dates[rows]
+        sub.amounts = self.amounts[rows]
+        sub.categories = self.categories[rows]
+        sub.ttypes = self.ttypes[rows]
+        sub.descriptions = self.descriptions[rows]
+        sub.is_income = self.is_income[rows]
+        sub.is_expense = self.is_expense[rows]
+        sub._date_order = None
+        return sub
+
+    def to_transaction(self, i: int) -> Transaction:
+        return Transaction(
+            id=int(self.ids[i]),
+            date=str(self.dates[i]),
+            amount=float(self.amounts[i]),
+            category=self.category_names[self.categories[i]],
+            ttype=self.ttype_names[self.ttypes[i]],
+            description=self.descriptions[i],
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for i in range(len(self)):
+            yield self.to_transaction(i)
+
+    def expenses_over(self, amount_threshold: float) -> 'TransactionTable':
+        return self.select(self.is_expense & (np.abs(self.amounts) > amount_threshold))
+
+    def by_category(self, category: str) -> 'TransactionTable':
+        c = category.lower()
+        codes = [i for i, name in enumerate(self.category_names) if name.lower() == c]
+        return self.select(self._code_mask(self.categories, codes))
+
+    def filter(self, spec: dict) -> 'TransactionTable':
+        """Combine the conditions of a compile_filter spec into one boolean mask."""
+        validate_filter_spec(spec)
+        mask = np.ones(len(self), dtype=bool)
+        if spec.get('ttype'):
+            mask &= self._type_mask(spec['ttype'])
+        if spec.get('min_amount') is not None:
+            mask &= np.abs(self.amounts) > float(spec['min_amount'])
+        if spec.get('category'):
+            c = str(spec['category']).lower()
+            mask &= self._code_mask(self.categories, [i for i, name in enumerate(self.category_names) if name.lower() == c])
+        if spec.get('start_date'):
+            mask &= self.dates >= np.datetime64(spec['start_date'], 'D')
+        if spec.get('end_date'):
+            mask &= self.dates <= np.datetime64(spec['end_date'], 'D')
+        return self.select(mask)
+
+    def date_range(self, start_date: Optional[str], end_date: Optional[str]) -> 'TransactionTable':
+        order, sorted_dates = self._date_index()
+        lo = np.searchsorted(sorted_dates, np.datetime64(start_date, 'D'), side='left') if start_date else 0
+        hi = np.searchsorted(sorted_dates, np.datetime64(end_date, 'D'), side='right') if end_date else len(self)
+        return self.select(order[lo:hi])
+
+    def _kernel(self):
+        # Small tables never trigger the numba import
+        return _numba_kernel() if len(self) >= NUMBA_MIN_ROWS else None
+
+    def balance_summary(self) -> Tuple[float, float, float]:
+        kernel = self._kernel()
+        if kernel is not None:
+            return kernel(self.amounts, self.is_income)
+        # Same rule as the list path: every non-income row counts as an expense
+        income = float(self.amounts[self.is_income].sum())
+        expenses = float(np.abs(self.amounts[~self.is_income]).sum())
+        return income, expenses, income - expenses
+
+    def monthly_spending(self) -> dict:
+        # bincount already runs in C; a numba loop here measured slower at every size
+        months = self.dates[self.is_expense].astype('datetime64[M]').astype(np.int64)
+        if not len(months):
+            return {}
+        # Scatter-add into one slot per month between the first and last month (no sort needed)
+        first = months.min()
+        slots = months - first
+        totals = np.bincount(slots, weights=np.abs(self.amounts[self.is_expense]))
+        present = np.flatnonzero(np.bincount(slots))
+        keys = (present + first).astype('datetime64[M]')
+        return {str(m): float(v) for m, v in zip(keys, totals[present])}
+
 # ------------------------- Core Data Operations -------------------------
 
+# C-level attribute getters used as sort keys (no Python frame per comparison key).
+# ISO YYYY-MM-DD strings sort lexicographically in date order, so dates need no parsing.
+SORT_KEYS = {
+    'id': attrgetter('id'),
+    'date': attrgetter('date'),
+    'amount': attrgetter('amount'),
+    'category': attrgetter('_category_lower'),
+}
+
+
+class TransactionStore:
+    """In-memory ledger: the list of transactions plus bookkeeping kept up to date on
+    every mutation instead of being recomputed on demand (e.g. the next free id).
+
+    Iterating a store yields its transactions, so it can be passed anywhere a
+    `List[Transaction]` is accepted.
+    """
+
+    def __init__(self, items: Iterable[Transaction] = ()):
+        self.items: List[Transaction] = list(items)
+        # Ids are monotonic: computed once here, then incremented on every add
+        self._next_id = max((t.id for t in self.items), default=0) + 1
+        # id -> position in self.items; remove() swaps the last row into the gap to keep it valid
+        self._by_id: dict = {t.id: i for i, t in enumerate(self.items)}
+        # Secondary indexes: lowercased category -> transactions, YYYY-MM -> expense rows,
+        # and YYYY-MM -> expense total. Like the date index below, they are built by the first
+        # query that needs them (so loading a file never pays for them), then kept up to date.
+        self._indexed = False
+        self._by_category: dict = {}
+        self._by_month: dict = defaultdict(list)
+        self._month_totals: dict = defaultdict(float)
+        # Rows kept sorted by date (ties in id order) for bisect range queries
+        self._by_date: Optional[List[Transaction]] = None
+        self._dates_sorted: List[str] = []
+        # Search buffer: one "category\tdescription" line per row, rebuilt lazily after mutations
+        self._search_blob: Optional[str] = None
+        self._search_starts: List[int] = []
+
+    def _build_indexes(self) -> None:
+        for t in self.items:
+            self._index(t)
+        self._indexed = True
+
+    def _index(self, tx: Transaction) -> None:
+        self._by_category.setdefault(tx._category_lower, []).append(tx)
+        if tx.ttype == 'expense':
+            month = tx.date[:7]
+            self._by_month[month].append(tx)
+            self._month_totals[month] += abs(tx.amount)
+
+    def _unindex(self, tx: Transaction) -> None:
+        key = tx._category_lower
+        bucket = self._by_category[key]
+        bucket.remove(tx)
+        if not bucket:
+            del self._by_category[key]
+        if tx.ttype == 'expense':
+            month = tx.date[:7]
+            rows = self._by_month[month]
+            rows.remove(tx)
+            if rows:
+                # Re-sum the month rather than subtracting, which would accumulate float error
+                self._month_totals[month] = sum((abs(t.amount) for t in rows), 0.0)
+            else:
+                del self._by_month[month]
+                del self._month_totals[month]
+
+    def add(self, date: str, amount: float, category: str, ttype: str, description: str = "") -> Transaction:
+        tid = self._next_id
+        self._next_id += 1
+        tx = Transaction(id=tid, date=date, amount=amount, category=category, ttype=ttype, description=description)
+        self._by_id[tid] = len(self.items)
+        self.items.append(tx)
+        if self._indexed:
+            self._index(tx)
+        if self._by_date is None:
+            pass
+        elif not self._dates_sorted or date >= self._dates_sorted[-1]:
+            # Common case: transactions arrive in date order
+            self._by_date.append(tx)
+            self._dates_sorted.append(date)
+        else:
+            i = bisect_right(self._dates_sorted, date)
+            self._by_date.insert(i, tx)
+            self._dates_sorted.insert(i, date)
+        self._search_blob = None
+        return tx
+
+    def bulk_add(self, rows: Iterable[dict]) -> List[Transaction]:
+        """Add many transactions at once from dicts of `add()` keyword arguments.
+
+        Ids are assigned as one consecutive range and the indexes are updated in a batch
+        (the date index is re-sorted once instead of bisect-inserting row by row).
+        """
+        start = self._next_id
+        new = [Transaction(id=start + i, **r) for i, r in enumerate(rows)]
+        if not new:
+            return new
+        self._next_id = start + len(new)
+        base = len(self.items)
+        self._by_id.update((t.id, base + i) for i, t in enumerate(new))
+        self.items.extend(new)
+        if self._indexed:
+            for t in new:
+                self._index(t)
+        if self._by_date is not None:
+            dates = [t.date for t in new]
+            self._by_date.extend(new)
+            if (self._dates_sorted and dates[0] < self._dates_sorted[-1]) or any(a > b for a, b in zip(dates, dates[1:])):
+                self._by_date.sort(key=SORT_KEYS['date'])
+                self._dates_sorted = [t.date for t in self._by_date]
+            else:
+                self._dates_sorted.extend(dates)
+        self._search_blob = None
+        return new
+
+    def find(self, tid: int) -> Optional[Transaction]:
+        i = self._by_id.get(tid)
+        return self.items[i] if i is not None else None
+
+    def remove(self, tx: Transaction) -> None:
+        """Remove tx in O(1) by moving the last row into its slot (row order is not preserved)."""
+        i = self._by_id.pop(tx.id)
+        last = self.items.pop()
+        if i != len(self.items):
+            self.items[i] = last
+            self._by_id[last.id] = i
+        if self._indexed:
+            self._unindex(tx)
+        if self._by_date is not None:
+            lo = bisect_left(self._dates_sorted, tx.date)
+            hi = bisect_right(self._dates_sorted, tx.date)
+            for i in range(lo, hi):
+                if self._by_date[i] is tx:
+                    del self._by_date[i]
+                    del self._dates_sorted[i]
+                    break
+        self._search_blob = None
+
+    def _build_search_blob(self) -> str:
+        lines = []
+        starts = []
+        pos = 0
+        for t in self.items:
+            line = f"{t._category_lower}\t{t._description_lower}"
+            lines.append(line)
+            starts.append(pos)
+            pos += len(line) + 1
+        self._search_blob = "\n".join(lines)
+        self._search_starts = starts
+        return self._search_blob
+
+    def search(self, keyword: str) -> List[Transaction]:
+        kw = keyword.lower()
+        if not kw or '\t' in kw or '\n' in kw:
+            # The separators would let a match span fields/rows; use the per-row scan
+            return [t for t in self.items if kw in t._description_lower or kw in t._category_lower]
+        blob = self._search_blob if self._search_blob is not None else self._build_search_blob()
+        starts = self._search_starts
+        res = []
+        pos = blob.find(kw)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            res.append(self.items[row])
+            if row + 1 == len(starts):
+                break
+            # Skip the rest of this row so each transaction is reported once
+            pos = blob.find(kw, starts[row + 1])
+        return res
+
+    def by_category(self, category: str) -> List[Transaction]:
+        if not self._indexed:
+            self._build_indexes()
+        return list(self._by_category.get(category.lower(), ()))
+
+    def monthly_spending(self) -> dict:
+        if not self._indexed:
+            self._build_indexes()
+        return dict(sorted(self._month_totals.items()))
+
+    def date_range(self, start_date: Optional[str], end_date: Optional[str]) -> List[Transaction]:
+        """Transactions between the (inclusive) bounds, in date order."""
+        if self._by_date is None:
+            # remove() reorders self.items, so break date ties by id (assigned in insertion order)
+            self._by_date = sorted(self.items, key=attrgetter('date', 'id'))
+            self._dates_sorted = [t.date for t in self._by_date]
+        lo = bisect_left(self._dates_sorted, start_date) if start_date else 0
+        hi = bisect_right(self._dates_sorted, end_date) if end_date else len(self._dates_sorted)
+        return self._by_date[lo:hi]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return iter(self.items)
+
+    def __getitem__(self, i):
+        return self.items[i]
+
+
 def next_id(transactions: List[Transaction]) -> int:
+    if isinstance(transactions, TransactionStore):
+        return transactions._next_id
     return max((t.id for t in transactions), default=0) + 1
 
 
 def add_transaction(transactions: List[Transaction], date: str, amount: float, category: str, ttype: str, description: str = "") -> Transaction:
+    if isinstance(transactions, TransactionStore):
+        return transactions.add(date, amount, category, ttype, description)
     tid = next_id(transactions)
     tx = Transaction(id=tid, date=date, amount=amount, category=category, ttype=ttype, description=description)
     transactions.append(tx)
@@ -114,19 +592,21 @@ def add_transaction(transactions: List[Transaction], date: str, amount: float, c
 
 
 def list_transactions(transactions: List[Transaction], sort_key: Optional[str] = None, reverse: bool = False) -> List[Transaction]:
-    keyfn: Callable[[Transaction], object]
-    if sort_key == 'date':
-        keyfn = lambda t: datetime.strptime(t.date, DATE_FORMAT)
-    elif sort_key == 'amount':
-        keyfn = lambda t: t.amount
-    elif sort_key == 'category':
-        keyfn = lambda t: t.category.lower()
-    else:
-        keyfn = lambda t: t.id
+    if sort_key == 'date' and isinstance(transactions, TransactionTable):
+        if reverse:
+            # Negate instead of reversing the stable order so rows sharing a date keep their
+            # original order, as sorted(..., reverse=True) does
+            order = np.argsort(-transactions.dates.astype(np.int64), kind='stable')
+        else:
+            order = transactions._date_index()[0]
+        return [transactions.to_transaction(i) for i in order]
+    keyfn: Callable[[Transaction], object] = SORT_KEYS.get(sort_key, SORT_KEYS['id'])
     return sorted(transactions, key=keyfn, reverse=reverse)
 
 
 def find_by_id(transactions: List[Transaction], tid: int) -> Optional[Transaction]:
+    if isinstance(transactions, TransactionStore):
+        return transactions.find(tid)
     for t in transactions:
         if t.id == tid:
             return t
@@ -134,32 +614,87 @@ def find_by_id(transactions: List[Transaction], tid: int) -> Optional[Transactio
 
 
 def search_transactions(transactions: List[Transaction], keyword: str) -> List[Transaction]:
+    if isinstance(transactions, TransactionStore):
+        return transactions.search(keyword)
     kw = keyword.lower()
-    return [t for t in transactions if kw in t.description.lower() or kw in t.category.lower()]
+    return [t for t in transactions if kw in t._description_lower or kw in t._category_lower]
 
 
 def filter_expenses_over(transactions: List[Transaction], amount_threshold: float) -> List[Transaction]:
+    if isinstance(transactions, TransactionTable):
+        return transactions.expenses_over(amount_threshold)
     return [t for t in transactions if t.ttype == 'expense' and abs(t.amount) > amount_threshold]
 
 
 def filter_by_category(transactions: List[Transaction], category: str) -> List[Transaction]:
+    if isinstance(transactions, (TransactionStore, TransactionTable)):
+        return transactions.by_category(category)
     c = category.lower()
-    return [t for t in transactions if t.category.lower() == c]
+    return [t for t in transactions if t._category_lower == c]
 
 
 def filter_by_date_range(transactions: List[Transaction], start_date: Optional[str], end_date: Optional[str]) -> List[Transaction]:
-    def to_dt(s: str) -> datetime:
-        return datetime.strptime(s, DATE_FORMAT)
+    if isinstance(transactions, (TransactionStore, TransactionTable)):
+        return transactions.date_range(start_date, end_date)
+    # ISO dates compare correctly as plain strings
     res = []
     for t in transactions:
-        dt = to_dt(t.date)
-        if start_date and dt < to_dt(start_date):
+        if start_date and t.date < start_date:
             continue
-        if end_date and dt > to_dt(end_date):
+        if end_date and t.date > end_date:
             continue
         res.append(t)
     return res
 
+
+FILTER_KEYS = ('ttype', 'min_amount', 'category', 'start_date', 'end_date')
+
+
+def validate_filter_spec(spec: dict) -> None:
+    """Raise ValueError if spec has keys other than FILTER_KEYS."""
+    unknown = set(spec) - set(FILTER_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown filter key(s): {', '.join(sorted(unknown))}")
+
+
+def compile_filter(spec: dict) -> Callable[[Transaction], bool]:
+    """Compile a filter spec into one fused predicate, cached per spec.
+
+    Supported keys (all optional): 'ttype', 'min_amount' (abs(amount) > x), 'category'
+    (case-insensitive), 'start_date' and 'end_date' (inclusive, YYYY-MM-DD). The spec's
+    values are baked into the source of a single lambda, so applying several filters
+    costs one pass over the transactions instead of one pass per filter.
+    """
+    validate_filter_spec(spec)
+    return _compile_filter(tuple(sorted(spec.items())))
+
+
+@lru_cache(maxsize=128)
+def _compile_filter(key: tuple) -> Callable[[Transaction], bool]:
+    spec = dict(key)
+    terms = []
+    if spec.get('ttype'):
+        terms.append(f"t.ttype == {str(spec['ttype'])!r}")
+    if spec.get('min_amount') is not None:
+        terms.append(f"abs(t.amount) > {float(spec['min_amount'])!r}")
+    if spec.get('category'):
+        terms.append(f"t._category_lower == {str(spec['category']).lower()!r}")
+    if spec.get('start_date'):
+        terms.append(f"t.date >= {str(spec['start_date'])!r}")
+    if spec.get('end_date'):
+        terms.append(f"t.date <= {str(spec['end_date'])!r}")
+    source = "lambda t: " + (" and ".join(terms) or "True")
+    # repr() of a float may be 'inf'/'nan', so provide those names
+    return eval(source, {'inf': float('inf'), 'nan': float('nan')})
+
+
+def filter_transactions(transactions: List[Transaction], spec: dict) -> List[Transaction]:
+    """Apply every condition in `spec` (see compile_filter) in a single pass."""
+    if isinstance(transactions, TransactionTable):
+        return transactions.filter(spec)
+    pred = compile_filter(spec)
+    return [t for t in transactions if pred(t)]
+
 # ------------------------- Persistence (sandbox-safe) -------------------------
 
 def _preferred_writable_path(filename: str) -> str:
@@ -176,11 +711,101 @@ def _preferred_writable_path(filename: str) -> str:
         return os.path.join(tempfile.gettempdir(), os.path.basename(filename))
 
 
-def save_transactions(transactions: List[Transaction], filename: str = DEFAULT_SAVE_FILE) -> bool:
+def _json_dumps(obj, pretty: bool = False, use_orjson: bool = True) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, using orjson when it is installed.
+
+    orjson writes NaN/Infinity as null, so pass use_orjson=False for data that may hold them;
+    stdlib json keeps them (as the non-standard NaN/Infinity tokens it also reads back).
+    """
+    if orjson is not None and use_orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity tokens; stdlib json accepts those and raises for real errors
+    return json.loads(data)
+
+
+# Files with these extensions are stored column-wise via pyarrow instead of as JSON
+COLUMNAR_EXTENSIONS = ('.parquet', '.feather')
+_COLUMNS = ('id', 'date', 'amount', 'category', 'ttype', 'description')  # Transaction field order
+
+
+def _is_columnar(filename: str) -> bool:
+    return os.path.splitext(filename)[1].lower() in COLUMNAR_EXTENSIONS
+
+
+def _import_pyarrow():
+    """Import pyarrow on first use; returns (pyarrow, feather, parquet) or None if not installed."""
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow, pyarrow.feather, pyarrow.parquet
+
+
+def _save_columnar(transactions: List[Transaction], target: str) -> None:
+    pa, feather, pq = _import_pyarrow()
+    txs = list(transactions)
+    types = (pa.int64(), pa.string(), pa.float64(), pa.string(), pa.string(), pa.string())
+    schema = pa.schema(list(zip(_COLUMNS, types)))
+    table = pa.table({name: [getattr(t, name) for t in txs] for name in _COLUMNS}, schema=schema)
+    if target.lower().endswith('.parquet'):
+        pq.write_table(table, target, compression='zstd')
+    else:
+        feather.write_feather(table, target, compression='zstd')
+
+
+def _load_columnar(path: str) -> TransactionStore:
+    _, feather, pq = _import_pyarrow()
+    if path.lower().endswith('.parquet'):
+        cols = pq.read_table(path).to_pydict()
+    else:
+        cols = feather.read_table(path).to_pydict()
+    # Go through the JSON record path so nulls, unpadded dates and int amounts get the same
+    # coercion and normalization as a hand-edited JSON file
+    return TransactionStore(Transaction._fast_from_json(dict(zip(_COLUMNS, row)))
+                            for row in zip(*(cols[name] for name in _COLUMNS)))
+
+
+def save_transactions(transactions: List[Transaction], filename: str = DEFAULT_SAVE_FILE, pretty: bool = False) -> bool:
+    """Save as compact JSON, streamed one record at a time; `pretty` writes indented JSON.
+
+    `.parquet` and `.feather` filenames are written in that columnar format instead (needs pyarrow).
+    """
+    if _is_columnar(filename) and _import_pyarrow() is None:
+        print(f"[warning] Saving '{filename}' requires pyarrow (pip install pyarrow).")
+        return False
     target = _preferred_writable_path(filename)
     try:
-        with open(target, 'w', encoding='utf-8') as f:
-            json.dump([t.to_dict() for t in transactions], f, indent=2)
+        if _is_columnar(target):
+            _save_columnar(transactions, target)
+            if target != filename:
+                print(f"[info] Save path '{filename}' not writable. Saved to '{target}' instead.")
+            return True
+        finite = all(math.isfinite(t.amount) for t in transactions)
+        with open(target, 'wb') as f:
+            if pretty:
+                f.write(_json_dumps([t.to_dict() for t in transactions], pretty=True, use_orjson=finite))
+            else:
+                f.write(b'[')
+                first = True
+                for t in transactions:
+                    if not first:
+                        f.write(b',')
+                    first = False
+                    f.write(_json_dumps(t.to_dict(), use_orjson=finite))
+                f.write(b']')
         if target != filename:
             print(f"[info] Save path '{filename}' not writable. Saved to '{target}' instead.")
         return True
@@ -189,7 +814,7 @@ def save_transactions(transactions: List[Transaction], filename: str = DEFAULT_S
         return False
 
 
-def load_transactions(filename: str = DEFAULT_SAVE_FILE) -> List[Transaction]:
+def load_transactions(filename: str = DEFAULT_SAVE_FILE) -> TransactionStore:
     # Try user-specified path first, then temp fallback
     candidates = [filename]
     if filename != DEFAULT_SAVE_FILE:
@@ -202,38 +827,48 @@ def load_transactions(filename: str = DEFAULT_SAVE_FILE) -> List[Transaction]:
         try:
             if not os.path.exists(path):
                 continue
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return [Transaction.from_dict(d) for d in data]
+            if _is_columnar(path):
+                if _import_pyarrow() is None:
+                    print(f"[warning] Reading '{path}' requires pyarrow (pip install pyarrow).")
+                    continue
+                return _load_columnar(path)
+            with open(path, 'rb') as f:
+                data = _json_loads(f.read())
+            return TransactionStore(Transaction._fast_from_json(d) for d in data)
         except OSError as e:
             print(f"[warning] Could not read '{path}': {e}")
         except json.JSONDecodeError as e:
             print(f"[warning] JSON in '{path}' is invalid: {e}")
-    return []
+        except (ValueError, KeyError, TypeError) as e:  # bad record, or pyarrow.ArrowInvalid
+            print(f"[warning] '{path}' is not a valid transactions file: {e}")
+    return TransactionStore()
 
 # ------------------------- Reports & Charts -------------------------
 
 def balance_summary(transactions: List[Transaction]) -> Tuple[float, float, float]:
-    income = sum(t.amount for t in transactions if t.ttype == 'income')
-    # expenses may be recorded as positive or negative; normalize
-    expenses_pos = sum(t.amount for t in transactions if t.ttype == 'expense' and t.amount >= 0)
-    expenses_neg = sum(-t.amount for t in transactions if t.ttype == 'expense' and t.amount < 0)
-    other_neg_expenses = sum(-t.amount for t in transactions if t.ttype != 'income' and t.amount < 0)
-    expenses = expenses_pos + expenses_neg
-    if other_neg_expenses:
-        expenses += other_neg_expenses
+    if isinstance(transactions, TransactionTable):
+        return transactions.balance_summary()
+    income = 0.0
+    expenses = 0.0
+    for t in transactions:
+        if t.ttype == 'income':
+            income += t.amount
+        else:
+            # Anything that is not income is an expense; it may be recorded as positive or
+            # negative, so normalize
+            expenses += t.amount if t.amount >= 0 else -t.amount
     savings = income - expenses
     return income, expenses, savings
 
 
 def monthly_spending(transactions: List[Transaction]) -> dict:
     # Returns dict of YYYY-MM -> total expense
-    totals = {}
+    if isinstance(transactions, (TransactionStore, TransactionTable)):
+        return transactions.monthly_spending()
+    totals: dict = defaultdict(float)
     for t in transactions:
-        if t.ttype != 'expense':
-            continue
-        month = t.date[:7]  # YYYY-MM
-        totals[month] = totals.get(month, 0) + abs(t.amount)
+        if t.ttype == 'expense':
+            totals[t.date[:7]] += abs(t.amount)  # YYYY-MM
     return dict(sorted(totals.items()))
 
 
@@ -241,12 +876,14 @@ def ascii_bar_chart(month_totals: dict, max_width: int = 40) -> str:
     if not month_totals:
         return "(no expense data to chart)"
     max_val = max(month_totals.values())
-    lines = []
-    for month, val in month_totals.items():
+    full_bar = '█' * max(1, max_width)  # each row slices this instead of building a new bar
+    buf = io.StringIO()
+    for i, (month, val) in enumerate(month_totals.items()):
         length = int((val / max_val) * max_width) if max_val > 0 else 0
-        bar = '█' * max(1, length)
-        lines.append(f"{month} | {bar} {val:.2f}")
-    return "\n".join(lines)
+        if i:
+            buf.write("\n")
+        buf.write(f"{month} | {full_bar[:max(1, length)]} {val:.2f}")
+    return buf.getvalue()
 
 # ------------------------- Utilities -------------------------
 
@@ -261,16 +898,36 @@ def pretty_print_transactions(transactions: List[Transaction]) -> None:
         print(f"{t.id:>3}  {t.date:10}  {t.ttype:7}  {amt:10}  {t.category:15.15}  {t.description}")
 
 
+def normalize_date(s: str) -> str:
+    """Return a valid date as zero-padded YYYY-MM-DD (strptime also accepts '2025-1-5').
+
+    Dates are compared and sorted as plain strings, which is only correct when padded.
+    Raises ValueError if s is not a date.
+    """
+    return datetime.strptime(s, DATE_FORMAT).strftime(DATE_FORMAT)
+
+
 def input_date(prompt: str) -> str:
     while True:
         s = input(prompt).strip()
         try:
-            datetime.strptime(s, DATE_FORMAT)
-            return s
+            return normalize_date(s)
         except ValueError:
             print(f"Please enter a date in {DATE_FORMAT} format (e.g. 2025-07-21).")
 
 
+def input_optional_date(prompt: str) -> Optional[str]:
+    """Like input_date, but a blank answer returns None."""
+    while True:
+        s = input(prompt).strip()
+        if not s:
+            return None
+        try:
+            return normalize_date(s)
+        except ValueError:
+            print(f"Please enter a date in {DATE_FORMAT} format (e.g. 2025-07-21) or leave it blank.")
+
+
 def input_float(prompt: str) -> float:
     while True:
         s = input(prompt).strip()
@@ -281,16 +938,18 @@ def input_float(prompt: str) -> float:
 
 # ------------------------- Demo / Sample Data -------------------------
 
-def sample_data() -> List[Transaction]:
-    txs: List[Transaction] = []
-    add_transaction(txs, '2025-01-03', 3000.00, 'Salary', 'income', 'Monthly salary')
-    add_transaction(txs, '2025-01-05', 45.20, 'Groceries', 'expense', 'Walmart shopping')
-    add_transaction(txs, '2025-01-10', 120.00, 'Utilities', 'expense', 'Electricity bill')
-    add_transaction(txs, '2025-02-01', 3000.00, 'Salary', 'income', 'Monthly salary')
-    add_transaction(txs, '2025-02-12', 250.00, 'Shopping', 'expense', 'New jacket')
-    add_transaction(txs, '2025-02-20', 12.00, 'Coffee', 'expense', 'Coffee shop')
-    add_transaction(txs, '2025-03-01', 3000.00, 'Salary', 'income', 'Monthly salary')
-    add_transaction(txs, '2025-03-14', 600.00, 'Rent', 'expense', 'March rent')
+def sample_data() -> TransactionStore:
+    txs = TransactionStore()
+    txs.bulk_add([
+        {'date': '2025-01-03', 'amount': 3000.00, 'category': 'Salary', 'ttype': 'income', 'description': 'Monthly salary'},
+        {'date': '2025-01-05', 'amount': 45.20, 'category': 'Groceries', 'ttype': 'expense', 'description': 'Walmart shopping'},
+        {'date': '2025-01-10', 'amount': 120.00, 'category': 'Utilities', 'ttype': 'expense', 'description': 'Electricity bill'},
+        {'date': '2025-02-01', 'amount': 3000.00, 'category': 'Salary', 'ttype': 'income', 'description': 'Monthly salary'},
+        {'date': '2025-02-12', 'amount': 250.00, 'category': 'Shopping', 'ttype': 'expense', 'description': 'New jacket'},
+        {'date': '2025-02-20', 'amount': 12.00, 'category': 'Coffee', 'ttype': 'expense', 'description': 'Coffee shop'},
+        {'date': '2025-03-01', 'amount': 3000.00, 'category': 'Salary', 'ttype': 'income', 'description': 'Monthly salary'},
+        {'date': '2025-03-14', 'amount': 600.00, 'category': 'Rent', 'ttype': 'expense', 'description': 'March rent'},
+    ])
     return txs
 
 # ------------------------- Command-line Interface -------------------------
@@ -334,6 +993,7 @@ def menu(data_file: str = DEFAULT_SAVE_FILE) -> None:
         print('10) Load transactions from file')
         print('11) Export to JSON filename')
         print('12) Delete transaction by ID')
+        print('13) Combined filter (type, minimum amount, category, date range)')
         print('0) Exit')
 
         try:
@@ -379,8 +1039,8 @@ def menu(data_file: str = DEFAULT_SAVE_FILE) -> None:
             pretty_print_transactions(res)
 
         elif choice == '6':
-            s = input('Start date (YYYY-MM-DD) or blank: ').strip() or None
-            e = input('End date (YYYY-MM-DD) or blank: ').strip() or None
+            s = input_optional_date('Start date (YYYY-MM-DD) or blank: ')
+            e = input_optional_date('End date (YYYY-MM-DD) or blank: ')
             res = filter_by_date_range(transactions, s, e)
             pretty_print_transactions(res)
 
@@ -410,7 +1070,7 @@ def menu(data_file: str = DEFAULT_SAVE_FILE) -> None:
             if not fn:
                 print('Filename required.')
             else:
-                if save_transactions(transactions, fn):
+                if save_transactions(transactions, fn, pretty=True):
                     print(f'Exported to {fn}')
 
         elif choice == '12':
@@ -426,6 +1086,35 @@ def menu(data_file: str = DEFAULT_SAVE_FILE) -> None:
             else:
                 print('ID not found.')
 
+        elif choice == '13':
+            print('Leave any field blank to skip it.')
+            spec = {}
+            ttype = input('Type (income/expense): ').strip().lower()
+            if ttype in ('income', 'expense'):
+                spec['ttype'] = ttype
+            elif ttype:
+                print('Invalid type — ignoring it.')
+            amt = input('Amount over: ').strip()
+            if amt:
+                try:
+                    min_amount: Optional[float] = float(amt)
+                except ValueError:
+                    min_amount = None
+                if min_amount is not None and math.isfinite(min_amount):
+                    spec['min_amount'] = min_amount
+                else:
+                    print('Invalid amount — ignoring it.')
+            cat = input('Category: ').strip()
+            if cat:
+                spec['category'] = cat
+            start = input_optional_date('Start date (YYYY-MM-DD): ')
+            if start:
+                spec['start_date'] = start
+            end = input_optional_date('End date (YYYY-MM-DD): ')
+            if end:
+                spec['end_date'] = end
+            pretty_print_transactions(filter_transactions(transactions, spec))
+
         elif choice == '0':
             print('Exit — do you want to auto-save before quitting? (y/N)')
             try:
@@ -469,6 +1158,11 @@ def run_demo() -> None:
 
 def run_self_tests() -> None:
     print("[tests] Starting self tests...")
+
+    def same_totals(a: dict, b: dict) -> bool:
+        # Incremental and from-scratch float sums may differ in the last bits
+        return list(a) == list(b) and all(abs(a[k] - b[k]) < 1e-9 for k in a)
+
     # Create sample transactions
     txs = sample_data()
     assert len(txs) == 8, "Sample data should have 8 transactions"
@@ -477,10 +1171,75 @@ def run_self_tests() -> None:
     next_tx = add_transaction(txs, '2025-03-20', 50.0, 'Snacks', 'expense', 'Late night snacks')
     assert next_tx.id == 9, f"Expected next ID 9, got {next_tx.id}"
 
+    # Test that ids stay monotonic after a delete
+    store = TransactionStore(txs)
+    store.remove(store[-1])
+    assert store.add('2025-03-21', 5.0, 'Snacks', 'expense').id == 10, "Store id counter failed"
+
+    # Test id lookup and swap-with-last removal keep the id index valid
+    id_store = TransactionStore(txs)
+    id_store.remove(find_by_id(id_store, 1))
+    assert find_by_id(id_store, 1) is None and all(find_by_id(id_store, t.id) is t for t in id_store), "Store id index failed"
+
+    # Test bulk_add assigns consecutive ids and keeps every index in sync (including an out-of-order date)
+    bulk = TransactionStore(txs)
+    monthly_spending(bulk), filter_by_date_range(bulk, None, None)  # build the lazy indexes first
+    added = bulk.bulk_add([
+        {'date': '2025-04-01', 'amount': 20.0, 'category': 'Coffee', 'ttype': 'expense'},
+        {'date': '2024-11-30', 'amount': 80.0, 'category': 'Gifts', 'ttype': 'expense', 'description': 'Gift'},
+    ])
+    assert [t.id for t in added] == [10, 11] and bulk.add('2025-04-02', 1.0, 'Coffee', 'expense').id == 12, "Bulk add ids failed"
+    assert all(find_by_id(bulk, t.id) is t for t in bulk), "Bulk add id index failed"
+    assert same_totals(monthly_spending(bulk), monthly_spending(list(bulk))), "Bulk add month index failed"
+    assert filter_by_date_range(bulk, None, None) == sorted(bulk, key=lambda t: t.date), "Bulk add date index failed"
+    assert [t.id for t in search_transactions(bulk, 'coffee')] == [6, 10, 12], "Bulk add search failed"
+
+    # Test the store's search buffer matches the per-row scan, including after mutations
+    for kw in ('salary', 'SHOP', 'a', 'snacks', 'zzz', ''):
+        assert search_transactions(store, kw) == search_transactions(list(store), kw), f"Store search failed for '{kw}'"
+
+    # Test the store's category and month indexes stay in sync with a linear scan
+    snack = store.add('2025-04-02', 7.5, 'snacks', 'expense')
+    assert [t.id for t in filter_by_category(store, 'SNACKS')] == [10, 11], "Store category index failed"
+    assert same_totals(monthly_spending(store), monthly_spending(list(store))), "Store month index failed"
+    store.remove(snack)
+    assert '2025-04' not in monthly_spending(store) and len(filter_by_category(store, 'snacks')) == 1, "Store index removal failed"
+    drift = TransactionStore()
+    drift.add('2025-05-01', 0.1, 'Coffee', 'expense')
+    middle = drift.add('2025-05-02', 0.2, 'Coffee', 'expense')
+    drift.add('2025-05-03', 0.3, 'Coffee', 'expense')
+    monthly_spending(drift)
+    drift.remove(middle)
+    assert monthly_spending(drift) == monthly_spending(list(drift)), "Store month total drifted after removal"
+    assert [t.id for t in search_transactions(store, 'snack')] == [10], "Store search after removal failed"
+
+    # Test the store's date index against the linear scan, including out-of-order adds
+    # (the index is built by the first query, then kept up to date by later adds/removes)
+    early = store.add('2024-12-31', 15.0, 'Gifts', 'expense')
+    assert store._by_date is None, "Store date index built before the first query"
+    for start, end in (('2025-01-01', '2025-01-31'), (None, '2025-01-05'), ('2025-02-01', None), (None, None), ('2026-01-01', None)):
+        if start == '2025-02-01':
+            store.add('2025-01-02', 4.0, 'Coffee', 'expense')
+        expected = sorted(filter_by_date_range(list(store), start, end), key=attrgetter('date', 'id'))
+        assert filter_by_date_range(store, start, end) == expected, f"Store date range failed for {start}..{end}"
+    store.remove(early)
+    assert filter_by_date_range(store, None, '2024-12-31') == [], "Store date index removal failed"
+    unpadded = TransactionStore([Transaction._fast_from_json({'id': 1, 'date': '2025-1-5', 'amount': 2.0})])
+    unpadded.add(normalize_date('2025-1-20'), 3.0, 'Coffee', 'expense')
+    assert [t.id for t in filter_by_date_range(unpadded, '2025-01-01', '2025-01-31')] == [1, 2], "Store date index with unpadded dates failed"
+
     # Test sorting by amount
     sorted_amt = list_transactions(txs, sort_key='amount')
     assert sorted_amt[0].amount <= sorted_amt[-1].amount, "Sorting by amount failed"
 
+    # Test unpadded dates are normalized on input and on load
+    assert normalize_date('2025-1-5') == '2025-01-05', "Date normalization failed"
+    assert Transaction._fast_from_json({'id': 1, 'date': '2025-1-5', 'amount': 1.0}).date == '2025-01-05', "Loaded date normalization failed"
+
+    # Test sorting by date
+    sorted_date = list_transactions(txs, sort_key='date', reverse=True)
+    assert [t.date for t in sorted_date] == sorted((t.date for t in txs), reverse=True), "Sorting by date failed"
+
     # Test filter expenses over 100
     over_100 = filter_expenses_over(txs, 100)
     assert all(t.ttype == 'expense' and abs(t.amount) > 100 for t in over_100), "Filter expenses over 100 failed"
@@ -493,11 +1252,24 @@ def run_self_tests() -> None:
     jan = filter_by_date_range(txs, '2025-01-01', '2025-01-31')
     assert all(t.date.startswith('2025-01') for t in jan), "Date range filter failed"
 
+    # Test the compiled combined filter matches chaining the individual filters
+    spec = {'ttype': 'expense', 'min_amount': 100, 'start_date': '2025-01-01', 'end_date': '2025-02-28'}
+    combined = filter_transactions(txs, spec)
+    assert combined == filter_by_date_range(filter_expenses_over(list(txs), 100), '2025-01-01', '2025-02-28'), "Combined filter failed"
+    assert compile_filter(dict(spec)) is compile_filter(spec), "Compiled filter cache failed"
+    assert filter_transactions(txs, {'category': 'GROCERIES'}) == groceries, "Combined category filter failed"
+    try:
+        filter_transactions(txs, {'amount': 1})
+        raise AssertionError("Combined filter accepted an unknown key")
+    except ValueError:
+        pass
+
     # Test monthly spending & chart
     mt = monthly_spending(txs)
     assert '2025-01' in mt and mt['2025-01'] > 0, "Monthly spending computation failed"
     chart = ascii_bar_chart(mt)
     assert isinstance(chart, str) and len(chart) > 0, "ASCII chart generation failed"
+    assert chart.splitlines()[-1] == f"2025-03 | {'█' * 40} 650.00", "ASCII chart bar scaling failed"
 
     # Test balance summary normalization with negative expenses
     txs2: List[Transaction] = []
@@ -505,6 +1277,36 @@ def run_self_tests() -> None:
     add_transaction(txs2, '2025-01-02', -200.0, 'Groceries', 'expense', 'Food')
     inc, exp, sav = balance_summary(txs2)
     assert inc == 1000.0 and abs(exp - 200.0) < 1e-9 and abs(sav - 800.0) < 1e-9, "Balance summary normalization failed"
+    add_transaction(txs2, '2025-01-03', 5.0, 'Savings', 'transfer', 'To savings')
+    assert balance_summary(txs2) == (1000.0, 205.0, 795.0), "Balance summary of a non-income type failed"
+
+    # Test the columnar NumPy table against the list implementation (numpy is optional)
+    if _import_numpy() is not None:
+        table = TransactionTable(txs)
+        assert len(table) == len(txs) and list(table) == list(txs), "TransactionTable round-trip failed"
+        assert balance_summary(table) == balance_summary(txs), "TransactionTable balance summary failed"
+        assert monthly_spending(table) == monthly_spending(txs), "TransactionTable monthly spending failed"
+        assert [t.id for t in filter_expenses_over(table, 100)] == [t.id for t in over_100], "TransactionTable expense filter failed"
+        assert list(filter_by_category(table, 'groceries')) == groceries, "TransactionTable category filter failed"
+        assert sorted(t.id for t in filter_by_date_range(table, '2025-01-01', '2025-01-31')) == [t.id for t in jan], "TransactionTable date range filter failed"
+        assert list(filter_transactions(table, spec)) == combined, "TransactionTable combined filter failed"
+        sub = filter_by_category(table, 'groceries')
+        assert list(sub.is_expense) == [t.ttype == 'expense' for t in groceries], "TransactionTable filter result type masks failed"
+        assert list(filter_by_date_range(sub, '2025-01-01', '2025-01-31')) == [t for t in jan if t in groceries], "TransactionTable filter result date range failed"
+        transfer = Transaction(99, '2025-01-15', 5.0, 'Savings', 'transfer')
+        assert list(TransactionTable([transfer])) == [transfer], "TransactionTable lost an unknown ttype"
+        assert balance_summary(TransactionTable(txs2)) == balance_summary(txs2), "TransactionTable balance rule differs"
+        by_date = list_transactions(table, sort_key='date')
+        assert [t.date for t in by_date] == sorted(t.date for t in txs), "TransactionTable date sort failed"
+        ties = TransactionTable(txs2 + [Transaction(4, '2025-01-02', 1.0, 'Coffee', 'expense')])
+        assert list_transactions(ties, sort_key='date', reverse=True) == list_transactions(list(ties), sort_key='date', reverse=True), "TransactionTable reverse date sort failed"
+        kernel = _numba_kernel()
+        if kernel is not None:
+            inc_nb, exp_nb, sav_nb = kernel(table.amounts, table.is_income)
+            inc_np, exp_np, sav_np = table.balance_summary()
+            assert abs(inc_nb - inc_np) < 1e-6 and abs(exp_nb - exp_np) < 1e-6, "Numba balance summary failed"
+    else:
+        print("[tests] numpy not installed; skipping TransactionTable checks.")
 
     # Test save/load round-trip (skip if FS is restricted)
     try:
@@ -512,6 +1314,12 @@ def run_self_tests() -> None:
         tmp.close()
         ok = save_transactions(txs, tmp.name)
         txs_rt = load_transactions(tmp.name) if ok else []
+        if ok:
+            assert list(txs_rt) == list(txs), "Save/load round-trip content mismatch"
+            assert [t._category_lower for t in txs_rt] == [t.category.lower() for t in txs], "Loaded transactions missing cached fields"
+            assert all(a.category is b.category and a.ttype is b.ttype for a, b in zip(txs_rt, txs)), "Loaded strings not interned"
+            ok = save_transactions(txs, tmp.name, pretty=True)
+            txs_rt = load_transactions(tmp.name) if ok else []
         try:
             os.remove(tmp.name)
         except Exception:
@@ -523,6 +1331,47 @@ def run_self_tests() -> None:
     except OSError as e:
         print(f"[tests] Filesystem restricted; skipping round-trip test: {e}")
 
+    # Test non-finite amounts survive a JSON round-trip (orjson would write them as null)
+    path = os.path.join(tempfile.gettempdir(), "pft_selftest_inf.json")
+    inf_store = TransactionStore([Transaction(1, '2025-01-01', float('inf'), 'Misc', 'expense')])
+    if save_transactions(inf_store, path):
+        assert [t.amount for t in load_transactions(path)] == [float('inf')], "Non-finite amount round-trip failed"
+        os.remove(path)
+
+    # Test hand-edited JSON records with loose types load through from_dict's coercions
+    path = os.path.join(tempfile.gettempdir(), "pft_selftest_loose.json")
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[{"id": "7", "date": "2025-01-01", "amount": "12.5", "category": "Food", '
+                    '"ttype": "expense", "description": null}, {"id": 8, "date": "2025-01-02", "amount": 3}]')
+        loose = load_transactions(path)
+        os.remove(path)
+        assert [(t.id, t.amount) for t in loose] == [(7, 12.5), (8, 3.0)], "Loose JSON record coercion failed"
+        assert loose.add('2025-01-03', 1.0, 'Food', 'expense').id == 9, "Next id after loose JSON load failed"
+    except OSError as e:
+        print(f"[tests] Filesystem restricted; skipping loose JSON test: {e}")
+
+    # Test Parquet/Feather round-trips (pyarrow is optional)
+    if _import_pyarrow() is not None:
+        for ext in COLUMNAR_EXTENSIONS:
+            path = os.path.join(tempfile.gettempdir(), f"pft_selftest{ext}")
+            if save_transactions(txs, path):
+                assert list(load_transactions(path)) == list(txs), f"{ext} round-trip failed"
+                os.remove(path)
+        # Files written by other tools may hold nulls, unpadded dates and int amounts
+        pa, _, pq = _import_pyarrow()
+        path = os.path.join(tempfile.gettempdir(), "pft_selftest_loose.parquet")
+        pq.write_table(pa.table({'id': [1, 2], 'date': ['2025-1-5', '2025-01-20'], 'amount': [12, 3],
+                                 'category': ['Food', 'Food'], 'ttype': ['expense', 'expense'],
+                                 'description': [None, 'Lunch']}), path)
+        loose = load_transactions(path)
+        os.remove(path)
+        assert [(t.date, t.amount, t.description) for t in loose] == [('2025-01-05', 12.0, 'None'), ('2025-01-20', 3.0, 'Lunch')], "Loose Parquet record coercion failed"
+        assert type(loose.find(1).amount) is float and monthly_spending(loose) == {'2025-01': 15.0}, "Loose Parquet amounts failed"
+        assert len(filter_by_date_range(loose, '2025-01-01', '2025-01-31')) == 2, "Loose Parquet date range failed"
+    else:
+        print("[tests] pyarrow not installed; skipping Parquet/Feather round-trips.")
+
     print("[tests] ALL TESTS PASSED")
 
 # ------------------------- Main -------------------------